@@ -4,22 +4,103 @@ import time
 import json
 import csv
 import random
+import re
+import hashlib
+import asyncio
+import threading
+import aiohttp
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, JavascriptException,
+    StaleElementReferenceException, ElementClickInterceptedException
+)
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from dataclasses import dataclass
 from typing import List, Optional
 import os
 from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlencode, quote
 
-@dataclass
+PEOPLE_SEARCH_URL = "https://www.linkedin.com/search/results/people/"
+CHROME_PROFILES_DIR = "chrome_profiles"
+COOKIES_FILE_TEMPLATE = ".li_cookies_{}.json"
+BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4", "*.webm",
+    # LinkedIn's media CDN serves images and video without file extensions
+    "*media.licdn.com/dms/image*", "*dms.licdn.com/playlist*",
+    "*/li/track*", "*.doubleclick.net/*"
+)
+CSV_FIELDNAMES = ('name', 'title', 'company', 'location', 'profile_url', 'about', 'connections')
+CSV_BUFFER_SIZE = 64 * 1024
+
+RATE_LIMIT_WINDOW = 60
+ACTION_JITTER = 0.3
+MAX_RETRY_BACKOFF = 30
+
+VOYAGER_SEARCH_URL = "https://www.linkedin.com/voyager/api/search/blended"
+VOYAGER_PAGE_SIZE = 49
+VOYAGER_CONCURRENCY = 5
+
+_CONTAINER_SELECTORS = (
+    ".iVQBdbUhhelimibSIqzFwVInEeWYnuzuXYt",
+    ".FUnoUCUWHqgqZSnCbQFYlmjMydtKKTZFBI",
+    "li.iVQBdbUhhelimibSIqzFwVInEeWYnuzuXYt",
+    ".search-results-container li",
+    ".reusable-search__result-container",
+    "[data-chameleon-result-urn*='member']"
+)
+_NAME_SELECTORS = (
+    "a[data-test-app-aware-link] span[aria-hidden='true']",
+    ".cVuaSJRqbNqHnilutFYDHJuqUTzYMuksamE a span[aria-hidden='true']",
+    "a span[aria-hidden='true']",
+    ".entity-result__title-text a"
+)
+_LINK_SELECTORS = (
+    "a[data-test-app-aware-link]",
+    ".cVuaSJRqbNqHnilutFYDHJuqUTzYMuksamE a",
+    "a[href*='/in/']"
+)
+_TITLE_SELECTORS = (
+    ".yfUkKdhgeLpjgQhByLNZHDeqKrdFoVhLu",
+    ".entity-result__primary-subtitle",
+    "div.t-14.t-black.t-normal"
+)
+_LOCATION_SELECTORS = (
+    ".zSSJMHVoDKMBnaZNdAshUPZWUHKNuZqwaVUXw",
+    "div.t-14.t-normal:not(.t-black)",
+    ".entity-result__summary"
+)
+_SUMMARY_SELECTORS = (
+    ".JPLdZSnfcNtQiDKPYwnBNWcWAqncdkolU",
+    ".entity-result__summary",
+    "p.t-12.t-black--light"
+)
+_FIELD_SELECTORS = {
+    "name": _NAME_SELECTORS,
+    "link": _LINK_SELECTORS,
+    "title": _TITLE_SELECTORS,
+    "location": _LOCATION_SELECTORS,
+    "summary": _SUMMARY_SELECTORS
+}
+_USERNAME_FIELD = (By.ID, "username")
+_NEXT_BUTTON = (By.CSS_SELECTOR, "button[aria-label='Next']")
+_RESULT_CARDS = (By.CSS_SELECTOR, ", ".join(_CONTAINER_SELECTORS))
+_NEXT_BUTTON_CLICKABLE = EC.element_to_be_clickable(_NEXT_BUTTON)
+_RESULT_CARDS_PRESENT = EC.presence_of_element_located(_RESULT_CARDS)
+
+@dataclass(slots=True, frozen=True)
 class LinkedInProfile:
     name: str
     title: str
@@ -29,27 +110,140 @@ class LinkedInProfile:
     about: str = ""
     connections: str = ""
     
+def account_key(username: str) -> str:
+    """Filesystem-safe name for per-account session files, the hash keeps sanitized names unique"""
+    digest = hashlib.sha256(username.encode()).hexdigest()[:8]
+    safe_name = re.sub(r"[^\w.@-]", "_", username)
+    return f"{safe_name}_{digest}"
+    
+def profile_row(profile: LinkedInProfile) -> tuple:
+    return (profile.name, profile.title, profile.company, profile.location,
+            profile.profile_url, profile.about, profile.connections)
+    
+class ProfileCsvWriter:
+    """Appends profiles to a CSV as soon as they are scraped, safe to share between worker threads"""
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.rows = 0
+        self._lock = threading.Lock()
+        self._file = open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(CSV_FIELDNAMES)
+        
+    def write(self, profile: LinkedInProfile):
+        with self._lock:
+            self._writer.writerow(profile_row(profile))
+            self.rows += 1
+            
+    def close(self):
+        self._file.close()
+        
 class LinkedInPeopleScraper:
-    def __init__(self, config_path: str = "config.json"):
+    # Walks every result card in the browser and returns all fields in one payload,
+    # so a whole page costs a single round-trip
+    EXTRACT_PROFILES_JS = """
+        ((containerSelectors, fieldSelectors) => {
+            const firstMatch = (node, field) => {
+                for (const selector of fieldSelectors[field]) {
+                    const found = node.querySelector(selector);
+                    if (!found) continue;
+                    const value = field === "link" ? found.href : found.innerText.trim();
+                    if (value) return value;
+                }
+                return "";
+            };
+            for (const selector of containerSelectors) {
+                const nodes = document.querySelectorAll(selector);
+                if (!nodes.length) continue;
+                const rows = Array.from(nodes, node => {
+                    const row = {};
+                    for (const field of Object.keys(fieldSelectors)) row[field] = firstMatch(node, field);
+                    return row;
+                });
+                return {selector: selector, rows: rows};
+            }
+            return {selector: null, rows: []};
+        })(%s, %s)
+    """ % (json.dumps(_CONTAINER_SELECTORS), json.dumps(_FIELD_SELECTORS))
+    
+    # Scrolls down in 3 random chunks, then to the bottom (twice if more content loaded),
+    # pausing between steps in the browser and resolving with the final page height
+    SCROLL_PAGE_JS = """
+        (async (minDelay, maxDelay) => {
+            const pause = () => new Promise(resolve => setTimeout(resolve, minDelay + Math.random() * (maxDelay - minDelay)));
+            const lastHeight = document.body.scrollHeight;
+            for (let step = 0; step < 3; step++) {
+                window.scrollTo(0, Math.floor(lastHeight * (0.3 + Math.random() * 0.4)));
+                await pause();
+            }
+            window.scrollTo(0, document.body.scrollHeight);
+            await pause();
+            if (document.body.scrollHeight > lastHeight) {
+                window.scrollTo(0, document.body.scrollHeight);
+                await pause();
+            }
+            return document.body.scrollHeight;
+        })(%d, %d)
+    """
+    
+    def __init__(self, config_path: str = "config.json", csv_writer: Optional[ProfileCsvWriter] = None,
+                 seen_urls: Optional[set] = None, seen_lock: Optional[threading.Lock] = None):
+        self.config_path = config_path
+        self.cookies_file = None
         self.config = self.load_config(config_path)
         self.driver = None
-        self.profiles = []
         self.setup_logging()
         self.delay_min = self.config.get("delay_min", 2)
         self.delay_max = self.config.get("delay_max", 5)
         self.max_retries = self.config.get("max_retries", 3)
         self.debug_mode = self.config.get("debug_mode", False)
+        rate_limit = self.config.get("rate_limit_per_minute", 30)
+        if isinstance(rate_limit, bool) or not isinstance(rate_limit, int) or rate_limit < 1:
+            raise ValueError(f"rate_limit_per_minute must be a whole number of at least 1, got {rate_limit!r}")
+        self._action_times = deque(maxlen=rate_limit)
+        self.use_voyager_api = self.config.get("use_voyager_api", False)
+        self._title_matchers = {}
+        self.csv_writer = csv_writer
+        self._seen_urls = seen_urls if seen_urls is not None else set()
+        self._seen_lock = seen_lock or threading.Lock()
+        self._wait10 = None
+        self._wait15 = None
         
     def setup_logging(self):
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('linkedin_scraper.log'),
-                logging.StreamHandler()
-            ]
-        )
         self.logger = logging.getLogger(__name__)
+        self._log_listener = None
+        self._queue_handler = None
+        if logging.getLogger().handlers:
+            # Already configured, e.g. by the scraper that spawned this worker
+            return
+            
+        # Callers only enqueue records; the file and console writes happen on the listener thread
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler('linkedin_scraper.log')
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue()
+        self._queue_handler = QueueHandler(log_queue)
+        self._queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        logging.basicConfig(level=logging.INFO, handlers=[self._queue_handler])
+        
+        self._log_listener = QueueListener(log_queue, file_handler, stream_handler)
+        self._log_listener.start()
+        
+    def stop_logging(self):
+        """Flush the queue and log directly again, so records after the run are not left without a consumer"""
+        if not self._log_listener:
+            return
+            
+        root = logging.getLogger()
+        root.removeHandler(self._queue_handler)
+        self._log_listener.stop()
+        for handler in self._log_listener.handlers:
+            root.addHandler(handler)
+        self._log_listener = None
+        self._queue_handler = None
         
     def load_config(self, config_path: str) -> dict:
         try:
@@ -62,7 +256,7 @@ class LinkedInPeopleScraper:
             self.logger.error(f"Invalid JSON in config file {config_path}")
             raise
             
-    def setup_driver(self):
+    def setup_driver(self, user_data_dir: Optional[str] = None):
         chrome_options = Options()
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
@@ -84,8 +278,11 @@ class LinkedInPeopleScraper:
         chrome_options.add_argument("--log-level=3")
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36")
         
+        if user_data_dir:
+            chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+            
         if self.config.get("headless", False):
-            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--headless=new")
             
         self.logger.info("Setting up Chrome WebDriver...")
         self.driver = webdriver.Chrome(options=chrome_options)
@@ -94,23 +291,80 @@ class LinkedInPeopleScraper:
         self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
             "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
         })
-        self.driver.implicitly_wait(10)
+        self._wait10 = WebDriverWait(self.driver, 10)
+        self._wait15 = WebDriverWait(self.driver, 15)
         self.logger.info("WebDriver setup completed")
         
-    def login(self):
-        self.logger.info("Attempting to log in to LinkedIn...")
-        self.driver.get("https://www.linkedin.com/login")
+    def restore_session(self) -> bool:
+        """Reuse cookies saved by a previous login, returns True if they still give a logged-in feed"""
+        try:
+            with open(self.cookies_file, 'r') as f:
+                cookies = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Could not read saved cookies from {self.cookies_file}: {str(e)}")
+            return False
+            
+        session_cookie = next((c for c in cookies if c.get("name") == "li_at"), None)
+        if not session_cookie or session_cookie.get("expiry", float("inf")) <= time.time():
+            self.logger.info("Saved LinkedIn session has expired")
+            return False
+            
+        self.driver.get("https://www.linkedin.com")
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except Exception as e:
+                if self.debug_mode:
+                    self.logger.warning(f"Debug - Skipping cookie {cookie.get('name')}: {str(e)}")
+                    
+        self.driver.get("https://www.linkedin.com/feed/")
+        if "/feed/" in self.driver.current_url:
+            self.logger.info("Restored LinkedIn session from saved cookies")
+            return True
+            
+        self.logger.info("Saved LinkedIn session was rejected, logging in again")
+        return False
+        
+    def save_session(self):
+        try:
+            # The li_at cookie is a full session token, keep it readable by the owner only
+            fd = os.open(self.cookies_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.driver.get_cookies(), f)
+            os.chmod(self.cookies_file, 0o600)
+        except OSError as e:
+            self.logger.warning(f"Could not save cookies to {self.cookies_file}: {str(e)}")
+            
+    def block_resources(self):
+        """Stop loading media, fonts and trackers; JS and CSS are still needed for layout"""
+        self.driver.execute_cdp_cmd('Network.enable', {})
+        self.driver.execute_cdp_cmd('Network.setBlockedURLs', {"urls": list(BLOCKED_URL_PATTERNS)})
         
-        username = os.getenv('LINKEDIN_USERNAME') or self.config.get('username')
-        password = os.getenv('LINKEDIN_PASSWORD') or self.config.get('password')
+    def login(self, account: Optional[dict] = None):
+        if account:
+            username = account.get('username')
+            password = account.get('password')
+        else:
+            username = os.getenv('LINKEDIN_USERNAME') or self.config.get('username')
+            password = os.getenv('LINKEDIN_PASSWORD') or self.config.get('password')
         
         if not username or not password:
             self.logger.error("LinkedIn credentials not found in environment variables or config")
             raise ValueError("LinkedIn credentials required")
             
+        # Saved sessions are keyed by username so a session is never reused for other credentials
+        self.cookies_file = COOKIES_FILE_TEMPLATE.format(account_key(username))
+        if self.restore_session():
+            return
+            
+        self.logger.info("Attempting to log in to LinkedIn...")
+        self.driver.get("https://www.linkedin.com/login")
+        
         try:
-            username_field = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, "username"))
+            username_field = self._wait10.until(
+                EC.presence_of_element_located(_USERNAME_FIELD)
             )
             password_field = self.driver.find_element(By.ID, "password")
             
@@ -118,10 +372,11 @@ class LinkedInPeopleScraper:
             password_field.send_keys(password)
             password_field.send_keys(Keys.RETURN)
             
-            WebDriverWait(self.driver, 15).until(
+            self._wait15.until(
                 EC.url_contains("/feed/")
             )
             self.logger.info("Successfully logged in to LinkedIn")
+            self.save_session()
             
         except TimeoutException:
             self.logger.error("Login failed or took too long")
@@ -153,168 +408,95 @@ class LinkedInPeopleScraper:
         except Exception as e:
             self.logger.error(f"Debug error: {str(e)}")
     
-    def search_people(self, job_title: str, location: str = "") -> List[LinkedInProfile]:
+    def search_people(self, job_title: str, location: str = "") -> int:
         self.logger.info(f"Searching for people with title: {job_title}")
         
-        search_url = "https://www.linkedin.com/search/results/people/"
-        
-        query_params = []
+        query_params = {}
         if job_title:
-            query_params.append(f"keywords={job_title.replace(' ', '%20')}")
+            query_params["keywords"] = job_title
         if location:
-            query_params.append(f"geoUrn=[{location}]")
+            query_params["geoUrn"] = f"[{location}]"
             
+        search_url = PEOPLE_SEARCH_URL
         if query_params:
-            search_url += "?" + "&".join(query_params)
+            search_url += "?" + urlencode(query_params, quote_via=quote)
             
         try:
             self.driver.get(search_url)
             self.random_delay()
             
-            WebDriverWait(self.driver, 15).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
-            self.random_delay()
+            # readyState completes before the results are rendered, so wait for the cards themselves
+            self._wait15.until(_RESULT_CARDS_PRESENT)
             
+        except TimeoutException:
+            self.logger.warning(f"No results found for: {job_title}")
+            self.debug_page_elements()
+            return 0
         except Exception as e:
             self.logger.error(f"Failed to load search page: {str(e)}")
-            return []
+            return 0
         
         self.debug_page_elements()
         
-        profiles = []
+        profiles_found = 0
         page_count = 0
         max_pages = self.config.get("max_pages", 5)
         
         while page_count < max_pages:
             try:
+                try:
+                    self._wait10.until(_RESULT_CARDS_PRESENT)
+                except TimeoutException:
+                    self.logger.warning(f"Timed out waiting for results on page {page_count}")
+                    
                 self.scroll_page()
                 
-                profile_elements = []
-                selectors_to_try = [
-                    ".iVQBdbUhhelimibSIqzFwVInEeWYnuzuXYt",
-                    ".FUnoUCUWHqgqZSnCbQFYlmjMydtKKTZFBI",
-                    "li.iVQBdbUhhelimibSIqzFwVInEeWYnuzuXYt",
-                    ".search-results-container li",
-                    ".reusable-search__result-container",
-                    "[data-chameleon-result-urn*='member']"
-                ]
-                
-                for selector in selectors_to_try:
-                    profile_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if profile_elements:
-                        self.logger.info(f"Found {len(profile_elements)} elements with selector: {selector}")
-                        break
-                
-                if not profile_elements:
+                extracted = self.evaluate(self.EXTRACT_PROFILES_JS)
+                rows = extracted["rows"]
+                if rows:
+                    self.logger.info("Found %d elements with selector: %s", len(rows), extracted['selector'])
+                else:
                     self.logger.warning(f"No profile elements found on page {page_count}")
                     if self.debug_mode:
                         self.debug_page_elements()
                     
                 profiles_found_on_page = 0
-                for element in profile_elements:
-                    profile = self.extract_profile_data(element)
-                    if profile and self.is_relevant_profile(profile, job_title):
-                        profiles.append(profile)
-                        profiles_found_on_page += 1
-                        self.logger.info(f"Found profile: {profile.name} - {profile.title}")
+                duplicates_on_page = 0
+                for row in rows:
+                    profile = self.extract_profile_data(row)
+                    if not profile or not self.is_relevant_profile(profile, job_title):
+                        continue
+                    if not self.is_new_profile(profile):
+                        duplicates_on_page += 1
+                        continue
+                    self.write_profile(profile)
+                    profiles_found_on_page += 1
+                    self.logger.info("Found profile: %s - %s", profile.name, profile.title)
                         
-                self.logger.info(f"Page {page_count + 1}: Found {profiles_found_on_page} relevant profiles")
+                self.logger.info("Page %d: Found %d relevant profiles", page_count + 1, profiles_found_on_page)
+                if duplicates_on_page:
+                    self.logger.warning("Page %d: Skipped %d profiles already collected", page_count + 1, duplicates_on_page)
+                profiles_found += profiles_found_on_page
                         
                 if not self.go_to_next_page():
                     break
                     
                 page_count += 1
-                time.sleep(random.uniform(3, 6))
+                self.acquire()
                 
             except Exception as e:
                 self.logger.error(f"Error on page {page_count}: {str(e)}")
                 break
                 
-        return profiles
+        return profiles_found
         
-    def extract_profile_data(self, element) -> Optional[LinkedInProfile]:
+    def extract_profile_data(self, row: dict) -> Optional[LinkedInProfile]:
         try:
-            name = "N/A"
-            name_selectors = [
-                "a[data-test-app-aware-link] span[aria-hidden='true']",
-                ".cVuaSJRqbNqHnilutFYDHJuqUTzYMuksamE a span[aria-hidden='true']",
-                "a span[aria-hidden='true']",
-                ".entity-result__title-text a"
-            ]
-            
-            for selector in name_selectors:
-                try:
-                    name_element = element.find_element(By.CSS_SELECTOR, selector)
-                    name = name_element.text.strip()
-                    if name:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            profile_url = ""
-            link_selectors = [
-                "a[data-test-app-aware-link]",
-                ".cVuaSJRqbNqHnilutFYDHJuqUTzYMuksamE a",
-                "a[href*='/in/']"
-            ]
-            
-            for selector in link_selectors:
-                try:
-                    link_element = element.find_element(By.CSS_SELECTOR, selector)
-                    profile_url = link_element.get_attribute("href")
-                    if profile_url:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            title = "N/A"
-            title_selectors = [
-                ".yfUkKdhgeLpjgQhByLNZHDeqKrdFoVhLu",
-                ".entity-result__primary-subtitle",
-                "div.t-14.t-black.t-normal"
-            ]
-            
-            for selector in title_selectors:
-                try:
-                    title_element = element.find_element(By.CSS_SELECTOR, selector)
-                    title = title_element.text.strip()
-                    if title:
-                        break
-                except NoSuchElementException:
-                    continue
-                
-            location = "N/A"
-            location_selectors = [
-                ".zSSJMHVoDKMBnaZNdAshUPZWUHKNuZqwaVUXw",
-                "div.t-14.t-normal:not(.t-black)",
-                ".entity-result__summary"
-            ]
-            
-            for selector in location_selectors:
-                try:
-                    location_element = element.find_element(By.CSS_SELECTOR, selector)
-                    location = location_element.text.strip()
-                    if location:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            summary = "N/A"
-            summary_selectors = [
-                ".JPLdZSnfcNtQiDKPYwnBNWcWAqncdkolU",
-                ".entity-result__summary",
-                "p.t-12.t-black--light"
-            ]
-            
-            for selector in summary_selectors:
-                try:
-                    summary_element = element.find_element(By.CSS_SELECTOR, selector)
-                    summary = summary_element.text.strip()
-                    if summary:
-                        break
-                except NoSuchElementException:
-                    continue
+            name = row.get("name") or "N/A"
+            profile_url = row.get("link") or ""
+            title = row.get("title") or "N/A"
+            location = row.get("location") or "N/A"
+            summary = row.get("summary") or "N/A"
                 
             if self.debug_mode:
                 self.logger.info(f"Debug - Extracted: {name} | {title} | {location} | {summary}")
@@ -338,73 +520,258 @@ class LinkedInPeopleScraper:
                 self.logger.error(f"Error extracting profile data: {str(e)}")
             return None
             
+    def get_session_cookies(self) -> dict:
+        """Grab the authenticated session cookies from the logged-in browser"""
+        cookies = {c["name"]: c["value"] for c in self.driver.get_cookies()}
+        if "li_at" not in cookies or "JSESSIONID" not in cookies:
+            raise ValueError("LinkedIn session cookies not found after login")
+        return {"li_at": cookies["li_at"], "JSESSIONID": cookies["JSESSIONID"]}
+        
+    async def fetch_search_page(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                                job_title: str, geo_id: str, start: int) -> dict:
+        filters = "List(resultType->PEOPLE)"
+        if geo_id:
+            filters = f"List(geoUrn->{geo_id},resultType->PEOPLE)"
+        params = {
+            "keywords": job_title,
+            "origin": "GLOBAL_SEARCH_HEADER",
+            "q": "all",
+            "filters": filters,
+            "count": VOYAGER_PAGE_SIZE,
+            "start": start
+        }
+        
+        async with semaphore:
+            await self.acquire_async()
+            async with session.get(VOYAGER_SEARCH_URL, params=params) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+                
+    def parse_search_results(self, data: dict) -> List[LinkedInProfile]:
+        profiles = []
+        for cluster in data.get("elements", []):
+            for hit in cluster.get("elements", []):
+                name = (hit.get("title") or {}).get("text", "").strip()
+                if not name:
+                    continue
+                    
+                title = (hit.get("headline") or {}).get("text", "").strip() or "N/A"
+                location = (hit.get("subline") or {}).get("text", "").strip() or "N/A"
+                summary = (hit.get("snippetText") or {}).get("text", "").strip() or "N/A"
+                profile_url = hit.get("navigationUrl", "")
+                if not profile_url and hit.get("publicIdentifier"):
+                    profile_url = f"https://www.linkedin.com/in/{hit['publicIdentifier']}"
+                    
+                profiles.append(LinkedInProfile(
+                    name=name,
+                    title=title,
+                    company=summary,
+                    location=location,
+                    profile_url=profile_url,
+                    about=summary
+                ))
+        return profiles
+        
+    async def search_people_async(self, job_title: str, location: str = "") -> int:
+        """Search people through the voyager API, fetching result pages concurrently"""
+        self.logger.info(f"Searching (voyager API) for people with title: {job_title}")
+        
+        cookies = self.get_session_cookies()
+        headers = {
+            "csrf-token": cookies["JSESSIONID"].strip('"'),
+            "x-restli-protocol-version": "2.0.0",
+            "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+        }
+        max_pages = self.config.get("max_pages", 5)
+        semaphore = asyncio.Semaphore(VOYAGER_CONCURRENCY)
+        
+        # The Rest.li filter list only takes a numeric geo ID; free text would break its syntax
+        geo_id = location.strip()
+        if geo_id and not geo_id.isdigit():
+            self.logger.warning(f"Voyager API location must be a numeric geo ID, ignoring location: {location}")
+            geo_id = ""
+            
+        # JSESSIONID carries literal quotes, so the jar must not re-quote it or it stops matching csrf-token
+        cookie_jar = aiohttp.CookieJar(quote_cookie=False)
+        cookie_jar.update_cookies(cookies)
+        
+        async with aiohttp.ClientSession(headers=headers, cookie_jar=cookie_jar) as session:
+            # The first page tells us how many results exist, so no request goes past the end
+            try:
+                first_page = await self.fetch_search_page(session, semaphore, job_title, geo_id, 0)
+            except Exception as e:
+                self.logger.error(f"Error on page 0: {str(e)}")
+                return 0
+                
+            total = (first_page.get("paging") or {}).get("total")
+            end = max_pages * VOYAGER_PAGE_SIZE
+            if isinstance(total, int):
+                end = min(end, total)
+                
+            results = [first_page] + await asyncio.gather(
+                *(self.fetch_search_page(session, semaphore, job_title, geo_id, start)
+                  for start in range(VOYAGER_PAGE_SIZE, end, VOYAGER_PAGE_SIZE)),
+                return_exceptions=True
+            )
+            
+        profiles_found = 0
+        for page, result in enumerate(results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error on page {page}: {str(result)}")
+                continue
+            page_profiles = [p for p in self.parse_search_results(result)
+                             if self.is_relevant_profile(p, job_title) and self.is_new_profile(p)]
+            self.logger.info("Page %d: Found %d relevant profiles", page + 1, len(page_profiles))
+            profiles_found += len(page_profiles)
+            for profile in page_profiles:
+                self.write_profile(profile)
+            
+        return profiles_found
+        
+    def search_people_api(self, job_title: str, location: str = "") -> int:
+        return asyncio.run(self.search_people_async(job_title, location))
+            
+    def get_title_matcher(self, job_title: str) -> Optional[re.Pattern]:
+        """Compile the job title keywords into one pattern, cached per job title"""
+        if job_title not in self._title_matchers:
+            keywords = job_title.lower().split()
+            self._title_matchers[job_title] = re.compile("|".join(map(re.escape, keywords))) if keywords else None
+        return self._title_matchers[job_title]
+        
     def is_relevant_profile(self, profile: LinkedInProfile, job_title: str) -> bool:
-        job_title_lower = job_title.lower()
-        profile_title_lower = profile.title.lower()
+        matcher = self.get_title_matcher(job_title)
+        return bool(matcher and matcher.search(profile.title.lower()))
+        
+    def reserve_action(self) -> float:
+        """Book the next action slot, returns how long to wait so that at most
+        rate_limit_per_minute actions happen within any minute"""
+        now = time.monotonic()
+        while self._action_times and now - self._action_times[0] > RATE_LIMIT_WINDOW:
+            self._action_times.popleft()
+            
+        wait = 0.0
+        if self._action_times and len(self._action_times) == self._action_times.maxlen:
+            wait = max(0.0, RATE_LIMIT_WINDOW - (now - self._action_times[0]))
+            self.logger.info("Rate limit reached, waiting %.1f seconds", wait)
+            
+        self._action_times.append(now + wait)
+        # Keep a little jitter so actions are not perfectly regular
+        return wait + random.uniform(0, ACTION_JITTER)
         
-        keywords = job_title_lower.split()
-        return any(keyword in profile_title_lower for keyword in keywords)
+    def acquire(self):
+        time.sleep(self.reserve_action())
         
+    async def acquire_async(self):
+        await asyncio.sleep(self.reserve_action())
+        
+    def is_new_profile(self, profile: LinkedInProfile) -> bool:
+        """Record the profile URL, returns False if it was already collected in this run"""
+        if not profile.profile_url:
+            return True
+        with self._seen_lock:
+            if profile.profile_url in self._seen_urls:
+                return False
+            self._seen_urls.add(profile.profile_url)
+            return True
+            
     def random_delay(self):
         """Add a random delay to avoid detection"""
         delay = random.uniform(self.delay_min, self.delay_max)
         time.sleep(delay)
         
-    def scroll_page(self):
+    def evaluate(self, expression: str):
+        """Evaluate a JS expression through DevTools, awaiting it if it returns a promise"""
+        response = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": True,
+            "awaitPromise": True
+        })
+        if "exceptionDetails" in response:
+            details = response["exceptionDetails"]
+            message = details.get("exception", {}).get("description") or details.get("text", "")
+            raise JavascriptException(message)
+        return response["result"].get("value")
+        
+    def scroll_page(self) -> int:
         """Scroll down the page with natural human-like behavior"""
         try:
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-            
-            # Scroll down in chunks with random pauses
-            for _ in range(3):  # Scroll in 3 steps
-                scroll_chunk = random.uniform(0.3, 0.7)  # Scroll 30%-70% each time
-                self.driver.execute_script(f"window.scrollTo(0, {int(last_height * scroll_chunk)});")
-                self.random_delay()
-            
-            # Final scroll to bottom
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            self.random_delay()
-            
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            if new_height > last_height:
-                # More content loaded, scroll a bit more
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                self.random_delay()
-                
+            self.acquire()
+            return self.evaluate(self.SCROLL_PAGE_JS % (0, int(ACTION_JITTER * 1000)))
         except Exception as e:
             self.logger.error(f"Error during page scrolling: {str(e)}")
+            return 0
+            
+    def retry_backoff(self, attempt: int):
+        time.sleep(min(2 ** attempt + random.random(), MAX_RETRY_BACKOFF))
+        
+    def wait_for_new_results(self, old_card):
+        """The URL changes before the new results render, so wait for the previous page's cards to go away"""
+        if old_card is None:
+            self.random_delay()
+            return
+        try:
+            self._wait10.until(EC.staleness_of(old_card))
+        except TimeoutException:
+            self.logger.warning("Previous results are still on the page, waiting before extracting")
+            self.random_delay()
             
     def go_to_next_page(self) -> bool:
         """Navigate to the next page of search results with retry logic"""
         try:
             # Wait for next button to be clickable
-            next_button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[aria-label='Next']"))
-            )
+            next_button = self._wait10.until(_NEXT_BUTTON_CLICKABLE)
             
             if next_button.is_enabled():
                 # Add some randomness to avoid detection
-                self.random_delay()
+                self.acquire()
                 
                 # Scroll the button into view
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-                self.random_delay()
+                self.acquire()
                 
                 # Click with retry logic
+                current_url = self.driver.current_url
+                cards = self.driver.find_elements(*_RESULT_CARDS)
+                old_card = cards[0] if cards else None
+                error = None
+                attempts = 0
                 for attempt in range(self.max_retries):
+                    attempts += 1
+                    retries_left = attempt < self.max_retries - 1
                     try:
-                        next_button.click()
-                        # Wait for page to load
-                        WebDriverWait(self.driver, 10).until(
-                            EC.staleness_of(next_button)
+                        try:
+                            next_button.click()
+                        except ElementClickInterceptedException:
+                            # An overlay is covering the button, a JS click goes through it
+                            self.driver.execute_script("arguments[0].click();", next_button)
+                        # LinkedIn updates the page= parameter as soon as it navigates
+                        self._wait10.until(
+                            EC.url_changes(current_url)
                         )
-                        self.random_delay()
+                        self.wait_for_new_results(old_card)
+                        self.acquire()
                         return True
+                    except StaleElementReferenceException as e:
+                        if self.driver.current_url != current_url:
+                            self.wait_for_new_results(old_card)
+                            self.acquire()
+                            return True
+                        error = e
+                        if retries_left:
+                            self.retry_backoff(attempt)
+                            # The results re-rendered under us, look the button up again
+                            try:
+                                next_button = self._wait10.until(_NEXT_BUTTON_CLICKABLE)
+                            except TimeoutException as lookup_error:
+                                error = lookup_error
+                                break
                     except Exception as e:
-                        if attempt == self.max_retries - 1:
-                            self.logger.error(f"Failed to click next button after {self.max_retries} attempts: {str(e)}")
-                            return False
-                        self.random_delay()
+                        error = e
+                        if retries_left:
+                            self.retry_backoff(attempt)
+                            
+                self.logger.error(f"Failed to click next button after {attempts} attempts: {str(error)}")
+                return False
             return False
         except (NoSuchElementException, TimeoutException) as e:
             self.logger.info(f"No more pages available: {str(e)}")
@@ -413,49 +780,58 @@ class LinkedInPeopleScraper:
             self.logger.error(f"Error navigating to next page: {str(e)}")
             return False
             
+    def default_csv_filename(self) -> str:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"linkedin_profiles_{timestamp}.csv"
+        
+    def open_csv(self, filename: str = None) -> str:
+        """Open the output CSV so profiles can be written as soon as they are scraped"""
+        self.csv_writer = ProfileCsvWriter(filename or self.default_csv_filename())
+        return self.csv_writer.filename
+        
+    def close_csv(self):
+        if self.csv_writer:
+            self.csv_writer.close()
+            
+    def write_profile(self, profile: LinkedInProfile):
+        if self.csv_writer:
+            self.csv_writer.write(profile)
+            
     def save_to_csv(self, profiles: List[LinkedInProfile], filename: str = None):
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"linkedin_profiles_{timestamp}.csv"
-            
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['name', 'title', 'company', 'location', 'profile_url', 'about', 'connections']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for profile in profiles:
-                writer.writerow({
-                    'name': profile.name,
-                    'title': profile.title,
-                    'company': profile.company,
-                    'location': profile.location,
-                    'profile_url': profile.profile_url,
-                    'about': profile.about,
-                    'connections': profile.connections
-                })
+        filename = filename or self.default_csv_filename()
+            
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(CSV_FIELDNAMES)
+            writer.writerows(profile_row(profile) for profile in profiles)
                 
         self.logger.info(f"Saved {len(profiles)} profiles to {filename}")
         return filename
         
-    def run_search(self) -> List[LinkedInProfile]:
+    def run_account_searches(self, searches: List[dict], account: Optional[dict] = None,
+                             user_data_dir: Optional[str] = None) -> int:
         try:
-            self.setup_driver()
-            self.login()
+            self.setup_driver(user_data_dir)
+            self.login(account)
+            # Only after login, a verification challenge solved by hand needs its images
+            if self.config.get("block_resources", True):
+                self.block_resources()
             
-            all_profiles = []
+            profiles_found = 0
             
-            for search_config in self.config["searches"]:
+            for search_config in searches:
                 job_title = search_config["job_title"]
                 location = search_config.get("location", "")
                 
                 self.logger.info(f"Starting search for: {job_title}")
-                profiles = self.search_people(job_title, location)
-                all_profiles.extend(profiles)
+                if self.use_voyager_api:
+                    profiles_found += self.search_people_api(job_title, location)
+                else:
+                    profiles_found += self.search_people(job_title, location)
                 
                 time.sleep(random.uniform(5, 10))
                 
-            self.profiles = all_profiles
-            return all_profiles
+            return profiles_found
             
         except Exception as e:
             self.logger.error(f"Error during scraping: {str(e)}")
@@ -464,19 +840,53 @@ class LinkedInPeopleScraper:
             if self.driver:
                 self.driver.quit()
                 
+    def run_search(self) -> int:
+        accounts = self.config.get("accounts") or []
+        searches = self.config["searches"]
+        
+        if len(accounts) < 2:
+            return self.run_account_searches(searches, accounts[0] if accounts else None)
+            
+        # One isolated browser per account; each worker keeps its own delays between searches
+        profiles_found = 0
+        with ThreadPoolExecutor(max_workers=len(accounts)) as executor:
+            futures = {}
+            for index, account in enumerate(accounts):
+                account_searches = searches[index::len(accounts)]
+                if not account_searches:
+                    continue
+                worker = LinkedInPeopleScraper(self.config_path, csv_writer=self.csv_writer,
+                                               seen_urls=self._seen_urls, seen_lock=self._seen_lock)
+                user_data_dir = os.path.abspath(os.path.join(CHROME_PROFILES_DIR, account_key(account.get("username", str(index)))))
+                future = executor.submit(worker.run_account_searches, account_searches, account, user_data_dir)
+                futures[future] = account.get("username", f"account {index}")
+                
+            for future in as_completed(futures):
+                try:
+                    profiles_found += future.result()
+                except Exception as e:
+                    self.logger.error(f"Worker for {futures[future]} failed: {str(e)}")
+                    
+        return profiles_found
+        
     def run(self):
+        filename = self.open_csv()
         try:
-            profiles = self.run_search()
+            profiles_found = self.run_search()
             
-            if profiles:
-                filename = self.save_to_csv(profiles)
-                self.logger.info(f"Scraping completed. Found {len(profiles)} profiles.")
+            if profiles_found:
+                self.logger.info(f"Scraping completed. Found {profiles_found} profiles.")
                 self.logger.info(f"Results saved to: {filename}")
             else:
                 self.logger.info("No profiles found matching the search criteria")
                 
         except Exception as e:
             self.logger.error(f"Scraping failed: {str(e)}")
+        finally:
+            self.close_csv()
+            if not self.csv_writer.rows:
+                os.remove(filename)
+            self.stop_logging()
             
 if __name__ == "__main__":
     scraper = LinkedInPeopleScraper()